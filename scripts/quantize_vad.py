@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Build the int8 Silero VAD model used by default (run by setup.sh).
+
+Quantizing silero_vad.onnx directly does nothing: its Conv and LSTM weights
+sit inside If subgraphs (one branch per sample rate, more below them that
+switch on input shapes), which quantize_dynamic skips. So this script:
+
+  1. lifts the 16kHz branch out into a standalone graph,
+  2. fixes the input shapes to one 512+64-sample window, so ONNX Runtime's
+     constant folding can resolve every shape-dependent If,
+  3. quantizes the resulting flat graph (int8 Conv and LSTM weights), and
+  4. checks that quantized ops are actually present.
+
+The first encoder conv, which sees the raw STFT magnitudes, stays FP32;
+quantizing it costs far more accuracy than all other layers together.
+
+Usage: python scripts/quantize_vad.py models/silero_vad.onnx
+"""
+
+import argparse
+import collections
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import onnx
+import onnxruntime as ort
+from onnx import helper, numpy_helper
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+SAMPLE_RATE = 16000
+INPUT_SHAPES = {"input": [1, 64 + 512], "state": [2, 1, 128]}
+
+# Kept at full precision (see module docstring)
+FP32_NODE_MARKERS = ("/encoder/0/",)
+
+
+def extract_16k_branch(model: onnx.ModelProto) -> onnx.ModelProto:
+    """Replace the top-level `If sr == 16000` with its 16kHz branch."""
+    graph = model.graph
+    constants = {
+        n.output[0]: numpy_helper.to_array(n.attribute[0].t)
+        for n in graph.node
+        if n.op_type == "Constant"
+    }
+    branch = None
+    for node in graph.node:
+        if node.op_type == "If":
+            cond = next(n for n in graph.node if node.input[0] in n.output)
+            if cond.op_type == "Equal" and any(
+                constants.get(name) == SAMPLE_RATE for name in cond.input
+            ):
+                branch = next(a.g for a in node.attribute if a.name == "then_branch")
+                if_outputs = list(node.output)
+                break
+    if branch is None:
+        raise ValueError("No 'sr == 16000' branch found; not a Silero v5 model?")
+
+    # The If's outputs feed the graph outputs through Identity nodes
+    rename = dict(zip([o.name for o in branch.output], if_outputs))
+    nodes = list(branch.node)
+    nodes += [helper.make_node("Identity", [b], [o]) for b, o in rename.items()]
+    nodes += [n for n in graph.node if n.op_type == "Identity" and n.input[0] in if_outputs]
+
+    inputs = []
+    for inp in graph.input:
+        inp = onnx.ValueInfoProto.FromString(inp.SerializeToString())
+        for dim, size in zip(inp.type.tensor_type.shape.dim, INPUT_SHAPES.get(inp.name, [])):
+            dim.dim_value = size
+        inputs.append(inp)
+
+    flat = helper.make_graph(
+        nodes, "silero_vad_16k", inputs, list(graph.output), list(branch.initializer)
+    )
+    result = helper.make_model(flat, opset_imports=model.opset_import)
+    result.ir_version = model.ir_version
+    return result
+
+
+def count_ops(model: onnx.ModelProto) -> collections.Counter:
+    """Count op types, including inside subgraphs."""
+    counts: collections.Counter = collections.Counter()
+
+    def walk(graph: onnx.GraphProto) -> None:
+        for node in graph.node:
+            counts[node.op_type] += 1
+            for attr in node.attribute:
+                if attr.type == onnx.AttributeProto.GRAPH:
+                    walk(attr.g)
+
+    walk(model.graph)
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Quantize the Silero VAD model to int8.")
+    parser.add_argument("model", type=Path, help="Path to silero_vad.onnx (v5)")
+    parser.add_argument("-o", "--output", type=Path, help="Default: <model>.int8.onnx")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.ERROR)  # quantize_dynamic's advisory warnings
+
+    model_path: Path = args.model
+    output: Path = args.output or model_path.with_name(
+        model_path.name.replace(".onnx", ".int8.onnx")
+    )
+    if not model_path.is_file():
+        print(f"❌ Model not found: {model_path}", file=sys.stderr)
+        return 1
+
+    with tempfile.TemporaryDirectory(prefix="clawlexa_vad_") as tmp:
+        lifted = os.path.join(tmp, "lifted.onnx")
+        folded = os.path.join(tmp, "folded.onnx")
+
+        try:
+            onnx.save(extract_16k_branch(onnx.load(str(model_path))), lifted)
+        except ValueError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+
+        # Constant-fold the shape-dependent Ifs away (standard ONNX ops only)
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+        opts.optimized_model_filepath = folded
+        ort.InferenceSession(lifted, sess_options=opts, providers=["CPUExecutionProvider"])
+
+        keep_fp32 = [
+            n.name
+            for n in onnx.load(folded).graph.node
+            if any(marker in n.name for marker in FP32_NODE_MARKERS)
+        ]
+        quantize_dynamic(
+            folded, str(output), weight_type=QuantType.QInt8, nodes_to_exclude=keep_fp32
+        )
+
+    ops = count_ops(onnx.load(str(output)))
+    if not ops["ConvInteger"] or not ops["DynamicQuantizeLSTM"] or ops["If"]:
+        print(f"❌ Quantization incomplete, ops: {dict(ops)}", file=sys.stderr)
+        output.unlink()
+        return 1
+
+    size_in = model_path.stat().st_size / 1e6
+    size_out = output.stat().st_size / 1e6
+    print(
+        f"✅ {output}: {ops['ConvInteger']} ConvInteger, "
+        f"{ops['DynamicQuantizeLSTM']} DynamicQuantizeLSTM "
+        f"({size_in:.2f}MB → {size_out:.2f}MB)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Quantize a Piper voice model to int8 (one-time).
+
+Writes <voice>.int8.onnx next to the original, plus a copy of its
+.onnx.json config, which Piper needs alongside every model file.
+Clawlexa prefers the int8 model when both are present.
+
+Usage: python scripts/quantize_voice.py voices/en_US-lessac-medium.onnx
+"""
+
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Quantize a Piper voice model to int8.")
+    parser.add_argument("model", type=Path, help="Path to the FP32 voice .onnx file")
+    args = parser.parse_args()
+
+    model: Path = args.model
+    if not model.is_file():
+        print(f"❌ Model not found: {model}", file=sys.stderr)
+        return 1
+
+    output = model.with_name(model.name.replace(".onnx", ".int8.onnx"))
+    print(f"🔧 Quantizing {model} → {output}...")
+    quantize_dynamic(str(model), str(output), weight_type=QuantType.QUInt8)
+
+    config = model.with_name(model.name + ".json")
+    if config.is_file():
+        shutil.copyfile(config, output.with_name(output.name + ".json"))
+    else:
+        print(f"⚠️  No voice config found at {config}; copy it to {output}.json manually.")
+
+    size_in = model.stat().st_size / 1e6
+    size_out = output.stat().st_size / 1e6
+    print(f"✅ Done: {size_in:.1f}MB → {size_out:.1f}MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Split a Piper voice into encoder and decoder graphs (one-time).
+
+The VITS waveform decoder dominates synthesis time, so it is quantized
+to int8 on its own while the text encoder, duration predictor and flow
+stay at FP32 for quality. Writes, next to the voice:
+
+    <voice>.encoder.onnx       text → latent (FP32)
+    <voice>.decoder.onnx       latent → waveform (FP32)
+    <voice>.decoder.int8.onnx  latent → waveform (int8 weights)
+
+Clawlexa runs the split pair automatically when both halves exist.
+Delete them to go back to the monolithic model.
+
+Usage: python scripts/split_piper.py voices/en_US-lessac-medium.onnx
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import onnx
+from onnx.utils import extract_model
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+# Node name prefix of the waveform decoder (the VITS `dec` module) in Piper exports
+DECODER_PREFIX = "/dec/"
+
+
+def find_decoder_inputs(model: onnx.ModelProto) -> list[str]:
+    """Tensors produced outside the decoder and consumed by it (the latent cut)."""
+    graph = model.graph
+    decoder_nodes = [n for n in graph.node if n.name.startswith(DECODER_PREFIX)]
+    if not decoder_nodes:
+        raise ValueError(f"No {DECODER_PREFIX}* nodes found; not a Piper VITS export?")
+
+    produced = {out for n in decoder_nodes for out in n.output}
+    initializers = {init.name for init in graph.initializer}
+    boundary: list[str] = []
+    for node in decoder_nodes:
+        for name in node.input:
+            if name and name not in produced and name not in initializers and name not in boundary:
+                boundary.append(name)
+    return boundary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Split a Piper voice into encoder/decoder.")
+    parser.add_argument("model", type=Path, help="Path to the voice .onnx file")
+    args = parser.parse_args()
+
+    model_path: Path = args.model
+    if not model_path.is_file():
+        print(f"❌ Model not found: {model_path}", file=sys.stderr)
+        return 1
+
+    stem = model_path.name[: -len(".onnx")]
+    encoder_path = model_path.with_name(f"{stem}.encoder.onnx")
+    decoder_path = model_path.with_name(f"{stem}.decoder.onnx")
+    decoder_int8_path = model_path.with_name(f"{stem}.decoder.int8.onnx")
+
+    model = onnx.load(str(model_path))
+    try:
+        latents = find_decoder_inputs(model)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    graph_inputs = [i.name for i in model.graph.input]
+    graph_outputs = [o.name for o in model.graph.output]
+    print(f"🔧 Cutting at {len(latents)} decoder input(s): {', '.join(latents)}")
+
+    extract_model(str(model_path), str(encoder_path), graph_inputs, latents)
+    extract_model(str(model_path), str(decoder_path), latents, graph_outputs)
+
+    # The decoder must be fed by the latents alone, or the cut is wrong
+    decoder_inputs = [i.name for i in onnx.load(str(decoder_path)).graph.input]
+    if sorted(decoder_inputs) != sorted(latents):
+        print(f"❌ Decoder needs unexpected inputs: {decoder_inputs}", file=sys.stderr)
+        encoder_path.unlink()
+        decoder_path.unlink()
+        return 1
+
+    print(f"🔧 Quantizing decoder → {decoder_int8_path}...")
+    quantize_dynamic(str(decoder_path), str(decoder_int8_path), weight_type=QuantType.QUInt8)
+
+    print(f"✅ Done: {encoder_path.name}, {decoder_path.name}, {decoder_int8_path.name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,18 +5,18 @@ Handles PyAudio streams, Bluetooth/USB device selection,
 and PulseAudio/PipeWire integration.
 """
 
-import io
+import collections
 import logging
-import math
-import struct
 import wave
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-import numpy as np
 import pyaudio
 import soundfile as sf
 
+import dsp
+from wav_util import pcm_to_wav_bytes
+
 logger = logging.getLogger("clawlexa.audio")
 
 # Chime: short 440Hz beep generated in-memory
@@ -24,18 +24,18 @@ _CHIME_FREQ = 880
 _CHIME_DURATION = 0.15  # seconds
 _CHIME_SAMPLE_RATE = 16000
 
+# WAV files up to this size are read into memory in one go by play_file
+_PLAY_FILE_MAX_INMEMORY = 8 * 1024 * 1024  # bytes
+
 
 def _generate_chime() -> bytes:
     """Generate a short beep as raw PCM bytes."""
     n_samples = int(_CHIME_SAMPLE_RATE * _CHIME_DURATION)
-    samples = []
-    for i in range(n_samples):
-        t = i / _CHIME_SAMPLE_RATE
-        # Sine wave with fade-in/fade-out envelope
-        envelope = min(1.0, i / 200) * min(1.0, (n_samples - i) / 200)
-        value = int(16000 * envelope * math.sin(2 * math.pi * _CHIME_FREQ * t))
-        samples.append(max(-32768, min(32767, value)))
-    return struct.pack(f"{len(samples)}h", *samples)
+    # Sine wave with fade-in/fade-out envelope
+    samples = dsp.synth_chime(
+        n_samples, float(_CHIME_FREQ), _CHIME_SAMPLE_RATE, 16000.0, 200
+    )
+    return samples.tobytes()
 
 
 class AudioManager:
@@ -45,19 +45,32 @@ class AudioManager:
         self.sample_rate: int = config.get("sample_rate", 16000)
         self.channels: int = config.get("channels", 1)
         self.chunk_size: int = config.get("chunk_size", 512)
+        # PortAudio buffer size; should equal (or be a small multiple of) the
+        # frame size consumers read, so reads never straddle host buffers
+        self.pa_buffer_size: int = config.get("pa_buffer_size") or self.chunk_size
         self.input_device: Optional[int] = config.get("input_device")
         self.output_device: Optional[int] = config.get("output_device")
+        self.log_devices: bool = config.get("log_devices", False)
+        preroll_duration: float = config.get("preroll_duration", 0.3)
 
         self._pa: Optional[pyaudio.PyAudio] = None
         self._input_stream: Optional[pyaudio.Stream] = None
+        self._stream_read: Optional[Callable[[int, bool], bytes]] = None
+        self._output_streams: dict[tuple[int, int, int], pyaudio.Stream] = {}
+        # Most recent captured frames, so recording can include audio from just
+        # before the wake word fired
+        self._preroll: collections.deque[bytes] = collections.deque(
+            maxlen=int(preroll_duration * self.sample_rate / self.chunk_size)
+        )
         self._chime_data: bytes = _generate_chime()
 
     def initialize(self) -> None:
         """Initialize PyAudio and open the input stream."""
         self._pa = pyaudio.PyAudio()
 
-        # Log available devices
-        self._log_devices()
+        # Log available devices (enumeration is slow with many virtual sinks)
+        if self.log_devices or logger.isEnabledFor(logging.DEBUG):
+            self._log_devices()
 
         # Open input stream (microphone)
         try:
@@ -66,15 +79,17 @@ class AudioManager:
                 "channels": self.channels,
                 "rate": self.sample_rate,
                 "input": True,
-                "frames_per_buffer": self.chunk_size,
+                "frames_per_buffer": self.pa_buffer_size,
             }
             if self.input_device is not None:
                 stream_kwargs["input_device_index"] = self.input_device
 
             self._input_stream = self._pa.open(**stream_kwargs)
+            self._stream_read = self._input_stream.read
             logger.info(
                 f"Audio input opened: {self.sample_rate}Hz, "
-                f"{self.channels}ch, chunk={self.chunk_size}"
+                f"{self.channels}ch, chunk={self.chunk_size}, "
+                f"buffer={self.pa_buffer_size}"
             )
         except Exception as e:
             raise RuntimeError(
@@ -84,9 +99,57 @@ class AudioManager:
                 f"to list available devices."
             ) from e
 
+        # Open the chime's output stream now so wake feedback is instant
+        try:
+            self._get_output_stream(_CHIME_SAMPLE_RATE, 1, 2)
+        except Exception as e:
+            logger.warning(f"Failed to open chime output stream: {e}")
+
+    def _get_output_stream(
+        self, rate: int, channels: int, sampwidth: int
+    ) -> pyaudio.Stream:
+        """
+        Get an open output stream for the given format, opening it on first use.
+
+        Streams are kept open and reused across calls, restarted if stop_output()
+        stopped them, and closed in cleanup().
+        """
+        key = (rate, channels, sampwidth)
+        stream = self._output_streams.get(key)
+        if stream is not None:
+            if stream.is_stopped():
+                stream.start_stream()
+        else:
+            stream_kwargs: dict = {
+                "format": self._pa.get_format_from_width(sampwidth),
+                "channels": channels,
+                "rate": rate,
+                "output": True,
+            }
+            if self.output_device is not None:
+                stream_kwargs["output_device_index"] = self.output_device
+
+            stream = self._pa.open(**stream_kwargs)
+            self._output_streams[key] = stream
+        return stream
+
+    def stop_output(self) -> None:
+        """
+        Stop the open output streams while nothing is playing.
+
+        The streams stay open for reuse, but a stopped stream lets the sound
+        server suspend the sink until the next playback restarts it.
+        """
+        for stream in self._output_streams.values():
+            try:
+                if not stream.is_stopped():
+                    stream.stop_stream()
+            except Exception as e:
+                logger.debug(f"Failed to stop output stream: {e}")
+
     def _log_devices(self) -> None:
         """Log available audio devices."""
-        if self._pa is None:
+        if self._pa is None or not logger.isEnabledFor(logging.INFO):
             return
         info = self._pa.get_host_api_info_by_index(0)
         num_devices = info.get("deviceCount", 0)
@@ -114,37 +177,37 @@ class AudioManager:
         Returns:
             Raw PCM audio bytes, or None on error.
         """
-        if self._input_stream is None:
+        if self._stream_read is None:
             return None
 
         frames = num_frames or self.chunk_size
 
         try:
-            data = self._input_stream.read(frames, exception_on_overflow=False)
+            data = self._stream_read(frames, False)  # exception_on_overflow=False
+            self._preroll.append(data)
             return data
         except IOError as e:
             logger.warning(f"Audio read error: {e}")
             return None
 
+    def clear_preroll(self) -> None:
+        """Forget the captured frames, so older audio can't prefix a recording."""
+        self._preroll.clear()
+
+    def drain_preroll(self) -> list[bytes]:
+        """Return and clear the most recently captured frames, oldest first."""
+        frames = list(self._preroll)
+        self._preroll.clear()
+        return frames
+
     def play_chime(self) -> None:
         """Play a short acknowledgment beep through the speaker."""
         if self._pa is None:
             return
 
         try:
-            stream_kwargs: dict = {
-                "format": pyaudio.paInt16,
-                "channels": 1,
-                "rate": _CHIME_SAMPLE_RATE,
-                "output": True,
-            }
-            if self.output_device is not None:
-                stream_kwargs["output_device_index"] = self.output_device
-
-            stream = self._pa.open(**stream_kwargs)
+            stream = self._get_output_stream(_CHIME_SAMPLE_RATE, 1, 2)
             stream.write(self._chime_data)
-            stream.stop_stream()
-            stream.close()
         except Exception as e:
             logger.warning(f"Failed to play chime: {e}")
 
@@ -167,25 +230,21 @@ class AudioManager:
         try:
             wf = wave.open(str(path), "rb")
 
-            stream_kwargs: dict = {
-                "format": self._pa.get_format_from_width(wf.getsampwidth()),
-                "channels": wf.getnchannels(),
-                "rate": wf.getframerate(),
-                "output": True,
-            }
-            if self.output_device is not None:
-                stream_kwargs["output_device_index"] = self.output_device
-
-            stream = self._pa.open(**stream_kwargs)
+            stream = self._get_output_stream(
+                wf.getframerate(), wf.getnchannels(), wf.getsampwidth()
+            )
 
-            chunk = 1024
-            data = wf.readframes(chunk)
-            while data:
-                stream.write(data)
+            frame_bytes = wf.getsampwidth() * wf.getnchannels()
+            if wf.getnframes() * frame_bytes <= _PLAY_FILE_MAX_INMEMORY:
+                # Small file: one read, one write
+                stream.write(wf.readframes(wf.getnframes()))
+            else:
+                chunk = 1024
                 data = wf.readframes(chunk)
+                while data:
+                    stream.write(data)
+                    data = wf.readframes(chunk)
 
-            stream.stop_stream()
-            stream.close()
             wf.close()
 
         except Exception as e:
@@ -203,19 +262,8 @@ class AudioManager:
             return
 
         try:
-            stream_kwargs: dict = {
-                "format": pyaudio.paInt16,
-                "channels": 1,
-                "rate": sample_rate,
-                "output": True,
-            }
-            if self.output_device is not None:
-                stream_kwargs["output_device_index"] = self.output_device
-
-            stream = self._pa.open(**stream_kwargs)
+            stream = self._get_output_stream(sample_rate, 1, 2)
             stream.write(audio_data)
-            stream.stop_stream()
-            stream.close()
 
         except Exception as e:
             logger.error(f"Failed to play audio bytes: {e}")
@@ -230,16 +278,11 @@ class AudioManager:
         Returns:
             WAV file content as bytes.
         """
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(pcm_data)
-        return buf.getvalue()
+        return pcm_to_wav_bytes(pcm_data, self.sample_rate, self.channels)
 
     def cleanup(self) -> None:
         """Close streams and terminate PyAudio."""
+        self._stream_read = None
         if self._input_stream is not None:
             try:
                 self._input_stream.stop_stream()
@@ -248,6 +291,14 @@ class AudioManager:
                 pass
             self._input_stream = None
 
+        for stream in self._output_streams.values():
+            try:
+                stream.stop_stream()
+                stream.close()
+            except Exception:
+                pass
+        self._output_streams.clear()
+
         if self._pa is not None:
             self._pa.terminate()
             self._pa = None
@@ -5,6 +5,7 @@ Communicates with the Clawdbot Gateway API via HTTP to process
 user requests through Claude.
 """
 
+import importlib.util
 import logging
 import os
 from typing import Optional
@@ -13,6 +14,8 @@ import httpx
 
 logger = logging.getLogger("clawlexa.brain")
 
+_CODE_BLOCK_SPEECH = "I have some code for that. "
+
 
 class ClawdbotBrain:
     """Communicates with Clawdbot Gateway for AI-powered responses."""
@@ -38,15 +41,25 @@ class ClawdbotBrain:
             )
 
     async def connect(self) -> None:
-        """Initialize the HTTP client."""
+        """Initialize the HTTP client and warm up a keep-alive connection."""
         self._client = httpx.AsyncClient(
             base_url=self.gateway_url,
+            # HTTP/2 needs the optional h2 package (httpx[http2])
+            http2=importlib.util.find_spec("h2") is not None,
             timeout=httpx.Timeout(self.timeout, connect=10.0),
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300.0),
             headers={
                 "Authorization": f"Bearer {self.gateway_token}",
                 "Content-Type": "application/json",
             },
         )
+
+        # Open the connection now so the first think() skips connect/TLS setup
+        try:
+            await self._client.head("/health")
+        except Exception as e:
+            logger.debug(f"Brain warm-up request failed: {e}")
+
         logger.info(f"Brain connected to Clawdbot Gateway at {self.gateway_url}")
 
     async def think(self, user_message: str) -> Optional[str]:
@@ -109,38 +122,118 @@ class ClawdbotBrain:
         Clean text for natural speech output.
 
         Removes markdown formatting, code blocks, and other
-        elements that don't make sense when spoken.
+        elements that don't make sense when spoken. Runs as a single
+        left-to-right scan rather than one regex pass per rule.
         """
-        import re
-
-        # Remove code blocks
-        text = re.sub(r"```[\s\S]*?```", "I have some code for that. ", text)
-        text = re.sub(r"`([^`]+)`", r"\1", text)
-
-        # Remove markdown headers
-        text = re.sub(r"#{1,6}\s+", "", text)
-
-        # Remove markdown bold/italic
-        text = re.sub(r"\*{1,3}([^*]+)\*{1,3}", r"\1", text)
-        text = re.sub(r"_{1,3}([^_]+)_{1,3}", r"\1", text)
-
-        # Remove markdown links, keep text
-        text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-
-        # Remove bullet points
-        text = re.sub(r"^\s*[-*+]\s+", "", text, flags=re.MULTILINE)
-
-        # Remove numbered lists markers
-        text = re.sub(r"^\s*\d+\.\s+", "", text, flags=re.MULTILINE)
-
-        # Collapse multiple newlines
-        text = re.sub(r"\n{2,}", ". ", text)
-        text = re.sub(r"\n", " ", text)
-
-        # Collapse multiple spaces
-        text = re.sub(r"\s{2,}", " ", text)
-
-        return text.strip()
+        out: list[str] = []
+        # Positions where a closing emphasis run or a link's "](url)" begins,
+        # mapped to the position just past it
+        skips: dict[int, int] = {}
+        at_line_start = True
+        i = 0
+        n = len(text)
+
+        while i < n:
+            if i in skips:
+                i = skips.pop(i)
+                continue
+
+            c = text[i]
+
+            # Whitespace: paragraph breaks become ". ", any other run one space
+            if c.isspace():
+                j = i
+                while j < n and text[j].isspace():
+                    j += 1
+                run = text[i:j]
+                if "\n\n" in run:
+                    while out and out[-1] == " ":
+                        out.pop()
+                    out.append(". ")
+                elif not out or not out[-1].endswith(" "):
+                    out.append(" ")
+                at_line_start = at_line_start or "\n" in run
+                i = j
+                continue
+
+            # Bullet points and numbered list markers
+            if at_line_start:
+                at_line_start = False
+                j = i
+                if c in "-*+":
+                    j = i + 1
+                else:
+                    while j < n and text[j].isdigit():
+                        j += 1
+                    j = j + 1 if j > i and j < n and text[j] == "." else i
+                if j > i and j < n and text[j].isspace():
+                    # A list swallows the paragraph break before it
+                    if out and out[-1] == ". ":
+                        out[-1] = " "
+                    while j < n and text[j].isspace():
+                        j += 1
+                    i = j
+                    continue
+
+            # Code blocks
+            if text.startswith("```", i):
+                end = text.find("```", i + 3)
+                if end != -1:
+                    out.append(_CODE_BLOCK_SPEECH)
+                    i = end + 3
+                    continue
+
+            # Inline code, keep the code text
+            if c == "`":
+                end = text.find("`", i + 1)
+                if end > i + 1:
+                    out.append(text[i + 1:end])
+                    i = end + 1
+                    continue
+
+            # Markdown headers
+            if c == "#":
+                j = i
+                while j < n and text[j] == "#":
+                    j += 1
+                if j < n and text[j].isspace():
+                    if j - i > 6:
+                        out.append("#" * (j - i - 6))
+                    while j < n and text[j].isspace():
+                        j += 1
+                    i = j
+                    continue
+
+            # Bold/italic: drop up to three marker chars on each side
+            if c == "*" or c == "_":
+                j = i
+                while j < n and text[j] == c:
+                    j += 1
+                end = text.find(c, j)
+                if end > j:
+                    close = end
+                    while close < n and close - end < 3 and text[close] == c:
+                        close += 1
+                    skips[end] = close
+                    if j - i > 3:
+                        out.append(c * (j - i - 3))
+                    i = j
+                    continue
+
+            # Links, keep the link text
+            if c == "[":
+                close = text.find("]", i + 1)
+                if close > i + 1 and text.startswith("(", close + 1):
+                    paren = text.find(")", close + 2)
+                    if paren > close + 2:
+                        skips[close] = paren + 1
+                        i += 1
+                        continue
+
+            out.append(c)
+            i += 1
+
+        return "".join(out).strip()
 
     async def disconnect(self) -> None:
         """Close the HTTP client."""
@@ -0,0 +1,28 @@
+"""
+Small DSP kernels for generated and post-processed audio.
+
+Kernels are vectorized NumPy. Numba is deliberately not used: importing it
+and compiling even a cached kernel costs several hundred milliseconds at
+startup, far more than these kernels take to run on NumPy.
+"""
+
+import numpy as np
+
+
+def apply_envelope(buf: np.ndarray, attack_samples: int, release_samples: int) -> None:
+    """Apply a linear fade-in/fade-out envelope to a float buffer in place."""
+    n = buf.shape[0]
+    idx = np.arange(n)
+    buf *= np.minimum(1.0, idx / attack_samples) * np.minimum(
+        1.0, (n - idx) / release_samples
+    )
+
+
+def synth_chime(
+    n_samples: int, freq: float, rate: int, amp: float, fade_samples: int = 200
+) -> np.ndarray:
+    """Synthesize an enveloped sine beep as int16 samples."""
+    t = np.arange(n_samples, dtype=np.float32) / rate
+    buf = amp * np.sin(2 * np.pi * freq * t)
+    apply_envelope(buf, fade_samples, fade_samples)
+    return buf.clip(-32768, 32767).astype(np.int16)
@@ -7,7 +7,9 @@ Main orchestrator loop:
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import math
 import os
 import signal
 import sys
@@ -71,6 +73,32 @@ def setup_logging(config: dict) -> None:
     )
 
 
+def _setup_audio_thread(realtime: bool) -> None:
+    """
+    Pin the calling (audio capture) thread to CPU 0 and give it SCHED_FIFO
+    priority when realtime is enabled. Needs root or CAP_SYS_NICE; falls back
+    to normal scheduling otherwise.
+    """
+    if not realtime:
+        return
+
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {0})
+        except OSError as e:
+            logger.warning(f"Could not pin audio thread to CPU 0: {e}")
+
+    if hasattr(os, "sched_setscheduler"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+            logger.info("Audio thread running with SCHED_FIFO priority")
+        except OSError as e:
+            logger.warning(
+                f"Could not raise audio thread priority: {e}. "
+                f"Grant CAP_SYS_NICE or disable audio.realtime."
+            )
+
+
 class Clawlexa:
     """Main voice assistant orchestrator."""
 
@@ -78,6 +106,16 @@ class Clawlexa:
         self.config = config
         self._running = False
         self._current_task: Optional[asyncio.Task] = None
+        self._rec_buf = bytearray()  # Reused capture buffer for _record_speech
+        # Transcription started on the speech prefix while trailing silence records
+        self._early_transcript: Optional[concurrent.futures.Future] = None
+        # Capture runs on its own thread so TTS/brain work can't starve it
+        self._audio_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="audio",
+            initializer=_setup_audio_thread,
+            initargs=(config.get("audio", {}).get("realtime", False),),
+        )
 
         # Initialize components
         self.audio = AudioManager(config.get("audio", {}))
@@ -88,6 +126,21 @@ class Clawlexa:
         self.tts = PiperTTS(config.get("tts", {}))
 
         self._chime_on_wake = config.get("feedback", {}).get("chime_on_wake", True)
+        self._early_transcribe = config.get("stt", {}).get("early_transcribe", True)
+
+        audio_config = config.get("audio", {})
+        self._silence_threshold: float = audio_config.get("silence_threshold", 2.0)
+        self._sample_rate: int = audio_config.get("sample_rate", 16000)
+        self._chunk_size: int = audio_config.get("chunk_size", 512)
+        self._chunk_duration: float = self._chunk_size / self._sample_rate
+        self._vad_batch: int = max(1, audio_config.get("vad_batch_chunks", 3))
+        # Trailing silence before the early transcription is sent. Each early
+        # request that speech then interrupts is a wasted (billed) upload, so
+        # normal pauses between words and phrases must not trigger one.
+        early_after = config.get("stt", {}).get("early_transcribe_after")
+        self._early_transcribe_after: float = (
+            early_after if early_after is not None else min(0.5, self._silence_threshold / 2)
+        )
 
     async def start(self) -> None:
         """Initialize all components and start the main loop."""
@@ -113,9 +166,12 @@ class Clawlexa:
         """Main assistant loop: wake → listen → think → speak → repeat."""
         while self._running:
             try:
-                # Step 1: Listen for wake word (blocking, runs in thread)
-                detected = await asyncio.get_event_loop().run_in_executor(
-                    None, self._wait_for_wake_word
+                # Step 1: Listen for wake word (blocking, runs in audio thread),
+                # letting the speaker sink suspend until there is output again
+                self.audio.stop_output()
+                loop = asyncio.get_running_loop()
+                detected = await loop.run_in_executor(
+                    self._audio_executor, self._wait_for_wake_word
                 )
                 if not detected or not self._running:
                     continue
@@ -128,17 +184,24 @@ class Clawlexa:
 
                 # Step 3: Record speech until silence (VAD)
                 logger.info("👂 Listening...")
-                audio_data = await asyncio.get_event_loop().run_in_executor(
-                    None, self._record_speech
+                audio_data = await loop.run_in_executor(
+                    self._audio_executor, self._record_speech, loop
                 )
+                early, self._early_transcript = self._early_transcript, None
 
                 if audio_data is None or len(audio_data) == 0:
+                    if early is not None:
+                        early.cancel()
                     logger.info("No speech detected, returning to wake word listening.")
                     continue
 
-                # Step 4: Speech-to-text
+                # Step 4: Speech-to-text (reuse the early request if it covers all speech)
                 logger.info("🔤 Transcribing...")
-                transcript = await self.stt.transcribe(audio_data)
+                transcript = None
+                if early is not None:
+                    transcript = await asyncio.wrap_future(early)
+                if transcript is None:
+                    transcript = await self.stt.transcribe(audio_data)
 
                 if not transcript or not transcript.strip():
                     logger.info("Empty transcript, ignoring.")
@@ -156,17 +219,9 @@ class Clawlexa:
 
                 logger.info(f"💬 Response: {response[:100]}...")
 
-                # Step 6: Text-to-speech
+                # Step 6 + 7: Text-to-speech, playing each chunk while the next renders
                 logger.info("🔊 Speaking...")
-                audio_file = await asyncio.get_event_loop().run_in_executor(
-                    None, self.tts.synthesize, response
-                )
-
-                # Step 7: Play response
-                if audio_file:
-                    await asyncio.get_event_loop().run_in_executor(
-                        None, self.audio.play_file, audio_file
-                    )
+                await self._speak(response)
 
                 logger.info("✅ Done. Listening for wake word...")
 
@@ -176,13 +231,25 @@ class Clawlexa:
                 logger.error(f"Error in main loop: {e}", exc_info=True)
                 await asyncio.sleep(1)  # Brief pause before retrying
 
+    async def _speak(self, text: str) -> None:
+        """Synthesize text in sentence chunks and play them back to back."""
+        chunks = self.tts.synthesize_stream(text)
+        pending = asyncio.ensure_future(asyncio.to_thread(next, chunks, None))
+        while True:
+            speech = await pending
+            if speech is None:
+                break
+            pending = asyncio.ensure_future(asyncio.to_thread(next, chunks, None))
+            pcm, rate = speech
+            await asyncio.to_thread(self.audio.play_bytes, pcm, rate)
+
     def _wait_for_wake_word(self) -> bool:
         """Block until wake word is detected. Returns False if shutting down."""
+        # The pre-roll still holds the end of the last recording; start it afresh
+        self.audio.clear_preroll()
         while self._running:
             try:
-                audio_frame = self.audio.read_frame(
-                    self.wake_word.frame_length
-                )
+                audio_frame = self.audio.read_frame(self.wake_word.frame_length)
                 if audio_frame is not None and self.wake_word.process(audio_frame):
                     return True
             except Exception as e:
@@ -190,35 +257,98 @@ class Clawlexa:
                 return False
         return False
 
-    def _record_speech(self) -> Optional[bytes]:
-        """Record audio until VAD detects silence. Returns raw PCM bytes."""
-        frames: list[bytes] = []
-        silence_threshold = self.config.get("audio", {}).get("silence_threshold", 2.0)
-        sample_rate = self.config.get("audio", {}).get("sample_rate", 16000)
-        chunk_size = self.config.get("audio", {}).get("chunk_size", 512)
+    def _record_speech(
+        self, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> Optional[bytes]:
+        """
+        Record audio until VAD detects silence. Returns raw PCM bytes.
+
+        If an event loop is given, transcription of the audio captured so far
+        is started on it once silence has lasted early_transcribe_after
+        seconds, and left in self._early_transcript if no further speech
+        follows.
+        """
+        silence_threshold = self._silence_threshold
+        sample_rate = self._sample_rate
+        chunk_size = self._chunk_size
+        chunk_duration = self._chunk_duration
+        vad_batch = self._vad_batch
+        early_after = self._early_transcribe_after
+
+        # Bind hot-loop methods to locals
+        read = self.audio.read_frame
+        is_speech = self.vad.is_speech
 
         self.vad.reset()
         silence_duration = 0.0
         has_speech = False
         max_duration = 30.0  # Maximum recording duration (seconds)
         total_duration = 0.0
-        chunk_duration = chunk_size / sample_rate
+
+        # Start with the audio captured just before the wake word fired. It is
+        # not run through VAD, since it holds the tail of the wake word itself.
+        preroll = self.audio.drain_preroll()
+
+        # Pre-size one buffer for the longest possible recording (16-bit mono)
+        max_bytes = (
+            sum(map(len, preroll))
+            + math.ceil(max_duration / chunk_duration) * chunk_size * 2
+        )
+        if len(self._rec_buf) < max_bytes:
+            self._rec_buf = bytearray(max_bytes)
+        buf = self._rec_buf
+        view = memoryview(buf)  # Slices of this reach VAD/STT without a copy
+        pos = 0
+
+        for frame in preroll:
+            n = len(frame)
+            buf[pos:pos + n] = frame
+            pos += n
+
+        vad_start = pos  # Offset in buf of the first chunk not yet checked by VAD
+        vad_chunks = 0
+        min_early_bytes = int(0.5 * sample_rate) * 2  # Need 500ms before going early
+        early: Optional[concurrent.futures.Future] = None
 
         while self._running and total_duration < max_duration:
-            frame = self.audio.read_frame(chunk_size)
+            frame = read(chunk_size)
             if frame is None:
                 break
 
-            frames.append(frame)
+            n = len(frame)
+            buf[pos:pos + n] = frame
+            pos += n
             total_duration += chunk_duration
+            vad_chunks += 1
 
-            is_speech = self.vad.is_speech(frame, sample_rate)
+            # Run VAD once per batch of chunks to amortize per-call overhead
+            if vad_chunks < vad_batch:
+                continue
 
-            if is_speech:
+            if is_speech(view[vad_start:pos], sample_rate):
                 has_speech = True
                 silence_duration = 0.0
+                if early is not None:
+                    # Speech resumed, so the early prefix is stale
+                    early.cancel()
+                    early = None
             else:
-                silence_duration += chunk_duration
+                silence_duration += vad_chunks * chunk_duration
+                if (
+                    has_speech
+                    and early is None
+                    and loop is not None
+                    and self._early_transcribe
+                    and silence_duration >= early_after
+                    and pos >= min_early_bytes
+                ):
+                    prefix = bytes(view[:pos])
+                    early = asyncio.run_coroutine_threadsafe(
+                        self.stt.transcribe(prefix, sample_rate), loop
+                    )
+
+            vad_start = pos
+            vad_chunks = 0
 
             # Stop if we had speech and then enough silence
             if has_speech and silence_duration >= silence_threshold:
@@ -226,9 +356,12 @@ class Clawlexa:
                 break
 
         if not has_speech:
+            if early is not None:
+                early.cancel()
             return None
 
-        return b"".join(frames)
+        self._early_transcript = early
+        return bytes(view[:pos])
 
     async def shutdown(self) -> None:
         """Gracefully shut down all components."""
@@ -258,6 +391,8 @@ class Clawlexa:
         except Exception as e:
             logger.debug(f"TTS cleanup: {e}")
 
+        self._audio_executor.shutdown(wait=False)
+
         logger.info("👋 Clawlexa stopped.")
 
 
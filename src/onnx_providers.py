@@ -0,0 +1,57 @@
+"""
+ONNX Runtime execution provider selection.
+
+Shared by the Silero VAD and Piper voice sessions. Providers are taken
+from the `onnx_providers` config list, in priority order; ones that the
+installed onnxruntime build does not offer are skipped, and the CPU
+provider is always kept as the last resort.
+"""
+
+import logging
+from typing import Optional, Union
+
+logger = logging.getLogger("clawlexa.onnx")
+
+DEFAULT_PROVIDERS = ["CPUExecutionProvider"]
+
+# Options passed to providers that need them.
+# CPU_FP32 keeps OpenVINO on the CPU at full precision.
+_PROVIDER_OPTIONS: dict[str, dict[str, str]] = {
+    "OpenVINOExecutionProvider": {"device_type": "CPU_FP32"},
+}
+
+
+def resolve_providers(
+    names: Optional[list[str]] = None,
+) -> list[Union[str, tuple[str, dict[str, str]]]]:
+    """
+    Build the `providers` argument for onnxruntime.InferenceSession.
+
+    Args:
+        names: Provider names in priority order, e.g.
+               ["OpenVINOExecutionProvider", "CPUExecutionProvider"].
+               None uses the CPU provider only.
+
+    Returns:
+        Provider names, or (name, options) tuples for providers that take
+        options, limited to those available in this onnxruntime build.
+    """
+    import onnxruntime
+
+    available = set(onnxruntime.get_available_providers())
+    providers: list[Union[str, tuple[str, dict[str, str]]]] = []
+    for name in names or DEFAULT_PROVIDERS:
+        if name not in available:
+            logger.warning(f"ONNX provider {name} is not available, skipping")
+            continue
+        options = _PROVIDER_OPTIONS.get(name)
+        providers.append((name, options) if options else name)
+
+    if "CPUExecutionProvider" not in (p if isinstance(p, str) else p[0] for p in providers):
+        providers.append("CPUExecutionProvider")
+    return providers
+
+
+def is_cpu_only(providers: list[Union[str, tuple[str, dict[str, str]]]]) -> bool:
+    """Whether a resolved provider list runs on the default CPU provider alone."""
+    return all((p if isinstance(p, str) else p[0]) == "CPUExecutionProvider" for p in providers)
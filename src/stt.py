@@ -7,11 +7,14 @@ Sends recorded audio to the Whisper API and returns the transcript.
 import io
 import logging
 import os
-import wave
 from typing import Optional
 
+import numpy as np
+import soundfile as sf
 from openai import AsyncOpenAI
 
+from wav_util import pcm_to_wav_bytes
+
 logger = logging.getLogger("clawlexa.stt")
 
 
@@ -21,6 +24,8 @@ class WhisperSTT:
     def __init__(self, config: dict) -> None:
         self.model: str = config.get("model", "whisper-1")
         self.language: Optional[str] = config.get("language", "en")
+        # "flac" (lossless, roughly half the upload size) or "wav"
+        self.upload_format: str = config.get("upload_format", "flac").lower()
         api_key = config.get("api_key") or os.getenv("OPENAI_API_KEY")
 
         if not api_key:
@@ -52,19 +57,11 @@ class WhisperSTT:
             return None
 
         try:
-            # Convert PCM to WAV in memory (Whisper API expects a file)
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, "wb") as wf:
-                wf.setnchannels(channels)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(sample_rate)
-                wf.writeframes(audio_data)
-
-            wav_buffer.seek(0)
-            wav_buffer.name = "audio.wav"  # OpenAI client needs a filename
+            # Whisper API expects a file; upload time dominates, so send FLAC
+            upload = self._encode_upload(audio_data, sample_rate, channels)
 
             # Call Whisper API
-            kwargs: dict = {"model": self.model, "file": wav_buffer}
+            kwargs: dict = {"model": self.model, "file": upload}
             if self.language:
                 kwargs["language"] = self.language
 
@@ -77,3 +74,22 @@ class WhisperSTT:
         except Exception as e:
             logger.error(f"Whisper API error: {e}", exc_info=True)
             return None
+
+    def _encode_upload(
+        self, audio_data: bytes, sample_rate: int, channels: int
+    ) -> tuple[str, io.BytesIO, str]:
+        """Wrap raw PCM in an in-memory audio file for upload as (name, file, mime)."""
+        if self.upload_format == "flac":
+            try:
+                samples = np.frombuffer(audio_data, dtype=np.int16)
+                if channels > 1:
+                    samples = samples.reshape(-1, channels)
+                buf = io.BytesIO()
+                sf.write(buf, samples, sample_rate, format="FLAC", subtype="PCM_16")
+                buf.seek(0)
+                return "audio.flac", buf, "audio/flac"
+            except Exception as e:
+                logger.debug(f"FLAC encoding failed, uploading WAV: {e}")
+
+        buf = io.BytesIO(pcm_to_wav_bytes(audio_data, sample_rate, channels))
+        return "audio.wav", buf, "audio/wav"
@@ -7,14 +7,114 @@ No internet connection required after voice model download.
 Voice models: https://github.com/rhasspy/piper/blob/master/VOICES.md
 """
 
+import io
+import json
 import logging
+import os
+import re
+import select
+import shutil
 import subprocess
 import tempfile
+import threading
+import wave
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional, Union
 
 logger = logging.getLogger("clawlexa.tts")
 
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Resolved piper binary and voice model, reused while the voices dir is unchanged
+_PATH_CACHE = Path.home() / ".cache" / "clawlexa" / "paths.json"
+
+
+def split_for_streaming(text: str, min_chars: int = 50, max_chars: int = 150) -> list[str]:
+    """
+    Split text into sentence-aligned chunks for incremental synthesis.
+
+    Short sentences are merged until a chunk reaches min_chars, so prosody
+    across boundaries stays natural; sentences longer than max_chars are
+    broken at the last space before the limit.
+    """
+    chunks: list[str] = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            head, sentence = sentence[:cut], sentence[cut:].lstrip()
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(head)
+
+        current = f"{current} {sentence}" if current else sentence
+        if len(current) >= min_chars:
+            chunks.append(current)
+            current = ""
+
+    if current:
+        chunks.append(current)
+    return [c for c in chunks if c.strip()]
+
+
+def _is_derived_model(path: Path) -> bool:
+    """True for model files generated from a voice (e.g. cached optimized graphs)."""
+    return path.name.endswith(
+        (".opt.onnx", ".encoder.onnx", ".decoder.onnx", ".decoder.int8.onnx")
+    )
+
+
+def _split_model_paths(model_path: Path) -> tuple[Path, Optional[Path]]:
+    """
+    Locate the encoder/decoder pair written by scripts/split_piper.py.
+
+    The pair is split from the FP32 voice, so a fully quantized
+    <voice>.int8.onnx maps to the same pair.
+
+    Returns:
+        (encoder path, decoder path), preferring the int8 decoder. The
+        decoder is None when no decoder file exists.
+    """
+    stem = model_path.name[: -len(".onnx")].removesuffix(".int8")
+    encoder = model_path.with_name(f"{stem}.encoder.onnx")
+    for name in (f"{stem}.decoder.int8.onnx", f"{stem}.decoder.onnx"):
+        decoder = model_path.with_name(name)
+        if decoder.exists():
+            return encoder, decoder
+    return encoder, None
+
+
+class _SplitVoiceSession:
+    """
+    Session stand-in that runs a split Piper voice as encoder, then decoder.
+
+    Exposes the subset of the onnxruntime.InferenceSession interface that
+    PiperVoice uses, so it can replace voice.session directly.
+    """
+
+    def __init__(self, encoder, decoder) -> None:
+        self.encoder = encoder
+        self.decoder = decoder
+        self._latent_names = [o.name for o in encoder.get_outputs()]
+
+    def get_inputs(self):
+        return self.encoder.get_inputs()
+
+    def get_outputs(self):
+        return self.decoder.get_outputs()
+
+    def get_providers(self) -> list[str]:
+        return self.decoder.get_providers()
+
+    def run(self, output_names, input_feed, run_options=None):
+        latents = self.encoder.run(None, input_feed, run_options)
+        return self.decoder.run(
+            output_names, dict(zip(self._latent_names, latents)), run_options
+        )
+
 
 class PiperTTS:
     """Piper TTS engine for local text-to-speech synthesis."""
@@ -24,26 +124,50 @@ class PiperTTS:
         self.voice_dir: Path = Path(config.get("voice_dir", "./voices"))
         self.speed: float = config.get("speed", 1.0)
         self.speaker_id: Optional[int] = config.get("speaker_id")
+        self.stream_min_chars: int = config.get("stream_min_chars", 50)
+        self.stream_max_chars: int = config.get("stream_max_chars", 150)
+        self.onnx_threads: int = config.get("onnx_threads", 2)
+        self.onnx_providers: Optional[list[str]] = config.get("onnx_providers")
 
         self._piper_bin: Optional[str] = None
         self._model_path: Optional[Path] = None
-        self._temp_dir = tempfile.mkdtemp(prefix="clawlexa_tts_")
+        # Keep per-utterance WAV files in RAM (tmpfs) where available
+        tmpfs = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        self._temp_dir = tempfile.mkdtemp(prefix="clawlexa_tts_", dir=tmpfs)
+
+        # Long-lived piper CLI process, so the voice model is loaded only once
+        self._piper_proc: Optional[subprocess.Popen] = None
+        self._piper_lock = threading.Lock()
+
+        # In-process piper-tts voice, loaded once and reused for every utterance.
+        # The lock keeps concurrent callers from sharing its session mid-run.
+        self._voice = None
+        self._voice_lock = threading.Lock()
 
     def initialize(self) -> None:
         """Verify Piper is installed and voice model is available."""
-        # Find piper binary
-        self._piper_bin = self._find_piper()
-        if not self._piper_bin:
-            raise RuntimeError(
-                "Piper TTS not found. Install it with: ./scripts/install_piper.sh\n"
-                "Or: pip install piper-tts"
-            )
+        self.voice_dir.mkdir(parents=True, exist_ok=True)
+        if self._load_path_cache():
+            logger.debug(f"Using cached piper paths from {_PATH_CACHE}")
+        else:
+            # Find piper binary
+            self._piper_bin = self._find_piper()
+            if not self._piper_bin:
+                raise RuntimeError(
+                    "Piper TTS not found. Install it with: ./scripts/install_piper.sh\n"
+                    "Or: pip install piper-tts"
+                )
+
+            # Check for voice model
+            self._model_path = self._find_voice_model()
+            if self._model_path:
+                self._save_path_cache()
 
-        # Check for voice model
-        self._model_path = self._find_voice_model()
         if self._model_path:
             logger.info(f"Piper TTS initialized with voice: {self.voice}")
             logger.info(f"Model: {self._model_path}")
+            if self.shared_voice() is None:
+                self._start_piper_process()
         else:
             logger.warning(
                 f"Voice model '{self.voice}' not found in {self.voice_dir}. "
@@ -51,17 +175,242 @@ class PiperTTS:
                 f"--update-voices"
             )
 
-    def _find_piper(self) -> Optional[str]:
-        """Find the piper binary or Python module."""
-        # Check if piper is in PATH
+    def shared_voice(self):
+        """
+        Get the loaded piper-tts PiperVoice, loading it on first use.
+
+        The same voice (and its ONNX session) is returned on every call, so
+        callers can share it instead of loading the model again.
+
+        Returns:
+            The PiperVoice, or None if the piper-tts package or model is unavailable.
+        """
+        if self._voice is not None:
+            return self._voice
+
         try:
-            result = subprocess.run(
-                ["which", "piper"], capture_output=True, text=True, timeout=5
+            from piper import PiperVoice
+        except ImportError:
+            return None
+
+        model_path = self._model_path
+        if model_path is None:
+            # Let piper download the model
+            model_path = self.voice
+
+        try:
+            self._voice = PiperVoice.load(str(model_path))
+            logger.debug(f"Loaded piper-tts voice from {model_path}")
+            if self._model_path is not None:
+                self._optimize_voice_session(self._voice, self._model_path)
+        except Exception as e:
+            logger.debug(f"piper-tts voice load failed: {e}")
+            self._voice = None
+        return self._voice
+
+    def _optimize_voice_session(self, voice, model_path: Path) -> None:
+        """
+        Replace the voice's ONNX Runtime session with a fully graph-optimized one.
+
+        The optimized graph is saved next to the model on first run
+        (<voice>.opt.onnx) and loaded directly afterwards, skipping fusion.
+        The cached graph is CPU-specific, so it is only used when no other
+        execution provider is configured. If scripts/split_piper.py has
+        produced an encoder/decoder pair for the model, that pair is run
+        instead.
+        """
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            return
+
+        from onnx_providers import is_cpu_only, resolve_providers
+
+        providers = resolve_providers(self.onnx_providers)
+        opt_path = model_path.with_suffix(".opt.onnx")
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        opts.intra_op_num_threads = self.onnx_threads
+        opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+
+        encoder, decoder = _split_model_paths(model_path)
+        if decoder is not None and encoder.exists():
+            try:
+                voice.session = _SplitVoiceSession(
+                    ort.InferenceSession(str(encoder), sess_options=opts, providers=providers),
+                    ort.InferenceSession(str(decoder), sess_options=opts, providers=providers),
+                )
+                logger.debug(f"Piper voice running split: {encoder.name} + {decoder.name}")
+                return
+            except Exception as e:
+                logger.debug(f"Split piper voice unusable, using {model_path.name}: {e}")
+
+        source = model_path
+        if is_cpu_only(providers):
+            if opt_path.exists() and opt_path.stat().st_mtime >= model_path.stat().st_mtime:
+                source = opt_path
+            else:
+                opts.optimized_model_filepath = str(opt_path)
+
+        try:
+            voice.session = ort.InferenceSession(
+                str(source), sess_options=opts, providers=providers
             )
-            if result.returncode == 0:
-                return result.stdout.strip()
+            logger.debug(
+                f"Piper voice session optimized ({voice.session.get_providers()[0]}, "
+                f"{self.onnx_threads} threads)"
+            )
+        except Exception as e:
+            logger.debug(f"Keeping default piper voice session: {e}")
+
+    def _piper_cli_args(self) -> list[str]:
+        """Model, speaker and speed arguments shared by all piper CLI invocations."""
+        args: list[str] = []
+        if self._model_path:
+            args.extend(["--model", str(self._model_path)])
+        else:
+            args.extend(["--model", self.voice])
+            args.extend(["--download-dir", str(self.voice_dir)])
+
+        if self.speaker_id is not None:
+            args.extend(["--speaker", str(self.speaker_id)])
+
+        if self.speed != 1.0:
+            args.extend(["--length-scale", str(1.0 / self.speed)])
+        return args
+
+    def _start_piper_process(self) -> None:
+        """Start a persistent piper CLI that reads JSON lines on stdin."""
+        if not self._piper_bin or self._piper_bin == "piper":
+            return
+
+        try:
+            self._piper_proc = subprocess.Popen(
+                [self._piper_bin, "--output_dir", self._temp_dir, "--json-input"]
+                + self._piper_cli_args(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+            logger.debug(f"Started persistent piper process (pid {self._piper_proc.pid})")
+        except Exception as e:
+            logger.debug(f"Failed to start persistent piper process: {e}")
+            self._piper_proc = None
+
+    def _try_piper_process(self, text: str, output_path: str, timeout: float = 30.0) -> bool:
+        """Try synthesizing with the persistent piper CLI process."""
+        proc = self._piper_proc
+        if proc is None or proc.poll() is not None:
+            return False
+
+        try:
+            with self._piper_lock:
+                proc.stdin.write(json.dumps({"text": text}) + "\n")
+                proc.stdin.flush()
+
+                # piper prints the path of each WAV it writes, one per line
+                ready, _, _ = select.select([proc.stdout], [], [], timeout)
+                if not ready:
+                    raise TimeoutError(f"no output after {timeout}s")
+                wav_path = proc.stdout.readline().strip()
+
+            if not wav_path:
+                raise RuntimeError("process exited")
+            os.replace(wav_path, output_path)
+            logger.debug(f"Synthesized {len(text)} chars via persistent piper process")
+            return True
+
+        except Exception as e:
+            logger.debug(f"Persistent piper process failed: {e}")
+            self._stop_piper_process()
+            return False
+
+    def _stop_piper_process(self) -> None:
+        """Close the persistent piper process, if running."""
+        proc, self._piper_proc = self._piper_proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
         except Exception:
-            pass
+            proc.kill()
+
+    def _path_cache_key(self) -> dict:
+        """Identify the voice setup that the cached paths were resolved for."""
+        return {
+            "voice": self.voice,
+            "voice_dir": str(self.voice_dir.resolve()),
+        }
+
+    @staticmethod
+    def _model_stamp(model: Path) -> dict:
+        """
+        Modification times that change when the resolved model is replaced,
+        or when an int8 copy that _find_voice_model would prefer appears
+        next to it.
+
+        Directory mtimes are deliberately not used: voices may live in
+        subdirectories, and writing <voice>.opt.onnx would change them on
+        every new optimized graph.
+        """
+        int8 = None
+        if not model.name.endswith(".int8.onnx"):
+            sibling = model.with_name(model.name.replace(".onnx", ".int8.onnx"))
+            if sibling.exists():
+                int8 = sibling.stat().st_mtime
+        return {"model_mtime": model.stat().st_mtime, "int8_mtime": int8}
+
+    def _load_path_cache(self) -> bool:
+        """
+        Restore the piper binary and model path from the on-disk cache.
+
+        Returns:
+            True if the cache matched the current voice setup, both cached
+            paths still exist, and the model has not been replaced or
+            superseded by an int8 copy since.
+        """
+        try:
+            cached = json.loads(_PATH_CACHE.read_text())
+            if any(cached.get(k) != v for k, v in self._path_cache_key().items()):
+                return False
+            piper_bin, model = cached["bin"], Path(cached["model"])
+            if piper_bin != "piper" and not os.path.exists(piper_bin):
+                return False
+            if not model.exists():
+                return False
+            if any(cached.get(k) != v for k, v in self._model_stamp(model).items()):
+                return False
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        self._piper_bin = piper_bin
+        self._model_path = model
+        return True
+
+    def _save_path_cache(self) -> None:
+        """Store the resolved piper binary and model path for the next start."""
+        try:
+            model = self._model_path.resolve()
+            _PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            entry = dict(
+                self._path_cache_key(),
+                bin=self._piper_bin,
+                model=str(model),
+                **self._model_stamp(model),
+            )
+            _PATH_CACHE.write_text(json.dumps(entry))
+        except OSError as e:
+            logger.debug(f"Could not write piper path cache: {e}")
+
+    def _find_piper(self) -> Optional[str]:
+        """Find the piper binary or Python module."""
+        # Check if piper is in PATH
+        path = shutil.which("piper")
+        if path:
+            return path
 
         # Check if piper-tts Python package is available
         try:
@@ -86,19 +435,24 @@ class PiperTTS:
         """Find the voice model file in the voices directory."""
         self.voice_dir.mkdir(parents=True, exist_ok=True)
 
-        # Look for .onnx model file
+        # Look for .onnx model file, preferring an int8-quantized copy
+        # (see scripts/quantize_voice.py) over the FP32 original
         patterns = [
+            f"{self.voice}.int8.onnx",
             f"{self.voice}.onnx",
+            f"{self.voice}/*.int8.onnx",
             f"{self.voice}/*.onnx",
         ]
 
         for pattern in patterns:
-            matches = list(self.voice_dir.glob(pattern))
+            matches = [m for m in self.voice_dir.glob(pattern) if not _is_derived_model(m)]
             if matches:
                 return matches[0]
 
         # Also check in subdirectories
         for onnx_file in self.voice_dir.rglob("*.onnx"):
+            if _is_derived_model(onnx_file):
+                continue
             if self.voice in onnx_file.stem or self.voice in str(onnx_file.parent):
                 return onnx_file
 
@@ -114,19 +468,82 @@ class PiperTTS:
         Returns:
             Path to the generated WAV file, or None on error.
         """
-        if not text or not text.strip():
+        output_path = str(Path(self._temp_dir) / "response.wav")
+        return self._render(text, output_path)
+
+    def synthesize_pcm(self, text: str) -> Optional[tuple[bytes, int]]:
+        """
+        Convert text to speech and return raw PCM audio in memory.
+
+        Args:
+            text: Text to synthesize.
+
+        Returns:
+            Tuple of (raw 16-bit mono PCM bytes, sample rate), or None on error.
+        """
+        # Python piper-tts renders straight into memory; the CLI needs a file
+        wav = self._render(text, io.BytesIO())
+        if wav is None:
             return None
 
-        output_path = Path(self._temp_dir) / "response.wav"
+        try:
+            with wave.open(wav, "rb") as wf:
+                return wf.readframes(wf.getnframes()), wf.getframerate()
+        except (EOFError, OSError, wave.Error) as e:
+            logger.error(f"Failed to read synthesized audio: {e}")
+            return None
+
+    def synthesize_stream(self, text: str) -> Iterator[tuple[bytes, int]]:
+        """
+        Synthesize text chunk by chunk, split on sentence boundaries.
+
+        Each chunk is rendered only when the caller asks for it, so playback
+        of one chunk can overlap synthesis of the next.
+
+        Args:
+            text: Text to synthesize.
+
+        Yields:
+            Tuples of (raw 16-bit mono PCM bytes, sample rate).
+        """
+        if not text or not text.strip():
+            return
+
+        for chunk in split_for_streaming(text, self.stream_min_chars, self.stream_max_chars):
+            speech = self.synthesize_pcm(chunk)
+            if speech is not None:
+                yield speech
+
+    def _render(
+        self, text: str, output: Union[str, BinaryIO]
+    ) -> Optional[Union[str, BinaryIO]]:
+        """
+        Render text to WAV with the first Piper backend that works.
+
+        Args:
+            text: Text to synthesize.
+            output: Where piper-tts writes the WAV: a file path, or a binary
+                    buffer. The CLI fallback always writes response.wav in
+                    the temp dir (on tmpfs when available).
+
+        Returns:
+            Where the WAV was written: `output` (rewound, if a buffer) or the
+            CLI's file path. None on error.
+        """
+        if not text or not text.strip():
+            return None
 
         try:
             # Try Python piper-tts module first
-            if self._try_piper_python(text, str(output_path)):
-                return str(output_path)
+            if self._try_piper_python(text, output):
+                if not isinstance(output, str):
+                    output.seek(0)
+                return output
 
             # Fall back to CLI
-            if self._try_piper_cli(text, str(output_path)):
-                return str(output_path)
+            output_path = str(Path(self._temp_dir) / "response.wav")
+            if self._try_piper_cli(text, output_path):
+                return output_path
 
             logger.error("All TTS methods failed")
             return None
@@ -135,27 +552,19 @@ class PiperTTS:
             logger.error(f"TTS synthesis error: {e}", exc_info=True)
             return None
 
-    def _try_piper_python(self, text: str, output_path: str) -> bool:
+    def _try_piper_python(self, text: str, output: Union[str, BinaryIO]) -> bool:
         """Try synthesizing with the piper-tts Python package."""
-        try:
-            from piper import PiperVoice
-            import wave
-
-            model_path = self._model_path
-            if model_path is None:
-                # Let piper download the model
-                model_path = self.voice
-
-            voice = PiperVoice.load(str(model_path))
+        voice = self.shared_voice()
+        if voice is None:
+            return False
 
-            with wave.open(output_path, "wb") as wav_file:
+        try:
+            with self._voice_lock, wave.open(output, "wb") as wav_file:
                 voice.synthesize(text, wav_file, speaker_id=self.speaker_id)
 
             logger.debug(f"Synthesized {len(text)} chars via piper-tts Python")
             return True
 
-        except ImportError:
-            return False
         except Exception as e:
             logger.debug(f"piper-tts Python failed: {e}")
             return False
@@ -165,20 +574,11 @@ class PiperTTS:
         if not self._piper_bin or self._piper_bin == "piper":
             return False
 
-        try:
-            cmd = [self._piper_bin, "--output_file", output_path]
-
-            if self._model_path:
-                cmd.extend(["--model", str(self._model_path)])
-            else:
-                cmd.extend(["--model", self.voice])
-                cmd.extend(["--download-dir", str(self.voice_dir)])
-
-            if self.speaker_id is not None:
-                cmd.extend(["--speaker", str(self.speaker_id)])
+        if self._try_piper_process(text, output_path):
+            return True
 
-            if self.speed != 1.0:
-                cmd.extend(["--length-scale", str(1.0 / self.speed)])
+        try:
+            cmd = [self._piper_bin, "--output_file", output_path] + self._piper_cli_args()
 
             result = subprocess.run(
                 cmd,
@@ -200,8 +600,8 @@ class PiperTTS:
             return False
 
     def cleanup(self) -> None:
-        """Clean up temporary files."""
-        import shutil
+        """Stop the piper process and clean up temporary files."""
+        self._stop_piper_process()
 
         try:
             shutil.rmtree(self._temp_dir, ignore_errors=True)
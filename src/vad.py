@@ -3,14 +3,19 @@ Voice Activity Detection using Silero VAD.
 
 Detects when the user starts and stops speaking, so we know
 when to stop recording after the wake word trigger.
+
+The Silero model runs through ONNX Runtime, so PyTorch is not needed.
 """
 
 import logging
-import struct
+import math
+from pathlib import Path
 from typing import Optional
 
 import numpy as np
-import torch
+import onnxruntime
+
+from onnx_providers import resolve_providers
 
 logger = logging.getLogger("clawlexa.vad")
 
@@ -20,72 +25,176 @@ class VoiceActivityDetector:
 
     def __init__(self, config: dict) -> None:
         self.sample_rate: int = config.get("sample_rate", 16000)
-        self._model: Optional[torch.jit.ScriptModule] = None
+        self.chunk_size: int = config.get("chunk_size", 512)
+        self.model_path: Path = Path(
+            config.get("vad_model", "./models/silero_vad.int8.onnx")
+        )
+        self.onnx_providers: Optional[list[str]] = config.get("onnx_providers")
+        self._session: Optional[onnxruntime.InferenceSession] = None
         self._threshold: float = 0.5
 
+        # Model input buffer: Silero v5 expects the trailing 64 samples of the
+        # previous window prepended to each 512-sample window. The buffer and
+        # the input dict are reused across calls.
+        self._window_size = 512
+        self._context_size = 64
+        self._input = np.zeros(
+            (1, self._context_size + self._window_size), dtype=np.float32
+        )
+        self._inputs: dict[str, np.ndarray] = {
+            "input": self._input,
+            "sr": np.array(self.sample_rate, dtype=np.int64),
+        }
+
+        # Recurrent state, double-buffered: each window's run reads one
+        # buffer and writes the other, then they swap. With IOBinding both
+        # stay bound across calls, so no state array is allocated or copied.
+        self._states = [np.zeros((2, 1, 128), dtype=np.float32) for _ in range(2)]
+        self._state_idx = 0
+        self._prob = np.zeros((1, 1), dtype=np.float32)
+        self._bindings: list = []  # One IOBinding per state buffer
+        self._ort_values: tuple = ()  # Keeps the bound OrtValues alive
+
     def initialize(self) -> None:
-        """Load the Silero VAD model."""
+        """Load the Silero VAD ONNX model."""
         try:
-            model, utils = torch.hub.load(
-                repo_or_dir="snakers4/silero-vad",
-                model="silero_vad",
-                trust_repo=True,
+            if self.sample_rate != 16000:
+                raise ValueError(f"Silero VAD requires 16kHz audio, got {self.sample_rate}Hz")
+            if self.chunk_size % self._window_size:
+                raise ValueError(
+                    f"Silero VAD needs {self._window_size}-sample frames, "
+                    f"got chunk_size={self.chunk_size}"
+                )
+
+            model_path = self.model_path
+            if not model_path.exists() and model_path.name.endswith(".int8.onnx"):
+                # Quantization is optional in setup.sh; use the FP32 model if absent
+                model_path = model_path.with_name(
+                    model_path.name.replace(".int8.onnx", ".onnx")
+                )
+            if not model_path.exists():
+                raise FileNotFoundError(
+                    f"{model_path} not found (run ./setup.sh to download it)"
+                )
+
+            opts = onnxruntime.SessionOptions()
+            opts.intra_op_num_threads = 1
+            opts.inter_op_num_threads = 1
+            self._session = onnxruntime.InferenceSession(
+                str(model_path),
+                sess_options=opts,
+                providers=resolve_providers(self.onnx_providers),
+            )
+            self.reset()
+            self._bind_io()
+            logger.info(
+                f"Silero VAD model loaded: {model_path} "
+                f"({self._session.get_providers()[0]})"
             )
-            self._model = model
-            logger.info("Silero VAD model loaded")
         except Exception as e:
             logger.warning(
                 f"Failed to load Silero VAD: {e}. "
                 f"Falling back to energy-based VAD."
             )
-            self._model = None
+            self._session = None
+
+    def _bind_io(self) -> None:
+        """Pre-bind the model's inputs and outputs to the persistent buffers."""
+        try:
+            ortvalue = onnxruntime.OrtValue.ortvalue_from_numpy
+            x = ortvalue(self._input)
+            sr = ortvalue(self._inputs["sr"])
+            prob = ortvalue(self._prob)
+            states = [ortvalue(state) for state in self._states]
+            out_name, state_name = [o.name for o in self._session.get_outputs()]
+
+            bindings = []
+            for i in (0, 1):
+                io = self._session.io_binding()
+                io.bind_ortvalue_input("input", x)
+                io.bind_ortvalue_input("state", states[i])
+                io.bind_ortvalue_input("sr", sr)
+                io.bind_ortvalue_output(out_name, prob)
+                io.bind_ortvalue_output(state_name, states[1 - i])
+                bindings.append(io)
+        except Exception as e:
+            logger.debug(f"Silero VAD IOBinding unavailable, using session.run: {e}")
+            self._bindings = []
+            return
+
+        self._ort_values = (x, sr, prob, *states)
+        self._bindings = bindings
 
     def reset(self) -> None:
         """Reset the VAD state for a new utterance."""
-        if self._model is not None:
-            self._model.reset_states()
+        for state in self._states:
+            state.fill(0.0)
+        self._input.fill(0.0)
 
     def is_speech(self, audio_frame: bytes, sample_rate: int = 16000) -> bool:
         """
         Check if an audio frame contains speech.
 
         Args:
-            audio_frame: Raw 16-bit PCM audio bytes.
+            audio_frame: Raw 16-bit PCM audio bytes (or a memoryview of
+                         them), a whole number of 512-sample frames (1024
+                         bytes each). May span several capture chunks;
+                         speech in any part counts.
             sample_rate: Sample rate of the audio.
 
         Returns:
             True if speech is detected in the frame.
+
+        Raises:
+            ValueError: If the audio is not a whole number of frames.
         """
-        if self._model is not None:
-            return self._silero_detect(audio_frame, sample_rate)
-        else:
+        if self._session is None:
             return self._energy_detect(audio_frame)
 
-    def _silero_detect(self, audio_frame: bytes, sample_rate: int) -> bool:
-        """Detect speech using Silero VAD model."""
+        step = self._window_size * 2
+        if len(audio_frame) % step:
+            raise ValueError(
+                f"VAD audio must be a multiple of {step} bytes, got {len(audio_frame)}"
+            )
+
         try:
-            # Convert bytes to float32 tensor
-            num_samples = len(audio_frame) // 2
-            pcm = struct.unpack_from(f"{num_samples}h", audio_frame)
-            audio_float = np.array(pcm, dtype=np.float32) / 32768.0
-            tensor = torch.from_numpy(audio_float)
-
-            # Silero VAD expects specific chunk sizes: 256, 512, or 768 for 16kHz
-            # Pad or trim to 512 if needed
-            target_size = 512
-            if len(tensor) < target_size:
-                tensor = torch.nn.functional.pad(tensor, (0, target_size - len(tensor)))
-            elif len(tensor) > target_size:
-                tensor = tensor[:target_size]
-
-            # Run VAD
-            confidence = self._model(tensor, sample_rate).item()
-            return confidence > self._threshold
+            # Silero's LSTM state is sequential, so run every window in order;
+            # speech in any of them counts
+            view = memoryview(audio_frame)
+            speech = False
+            for start in range(0, len(view), step):
+                if self._silero_window(view[start:start + step]) > self._threshold:
+                    speech = True
+            return speech
 
         except Exception as e:
             logger.debug(f"Silero VAD error: {e}")
             return self._energy_detect(audio_frame)
 
+    def _silero_window(self, frame: bytes) -> float:
+        """Run one 512-sample window through Silero and return its speech probability."""
+        ctx = self._context_size
+        x = self._input
+
+        # Convert bytes to float32 samples, after the previous window's tail
+        pcm = np.frombuffer(frame, dtype=np.int16)
+        np.multiply(pcm, 1.0 / 32768.0, out=x[0, ctx:], casting="unsafe")
+
+        # Run VAD
+        if self._bindings:
+            self._session.run_with_iobinding(self._bindings[self._state_idx])
+            self._state_idx ^= 1
+            prob = self._prob.item()
+        else:
+            state = self._states[self._state_idx]
+            self._inputs["state"] = state
+            out, new_state = self._session.run(None, self._inputs)
+            np.copyto(state, new_state)
+            prob = out.item()
+
+        x[0, :ctx] = x[0, -ctx:]  # Roll context forward
+        return prob
+
     @staticmethod
     def _energy_detect(audio_frame: bytes, threshold: float = 500.0) -> bool:
         """
@@ -98,10 +207,11 @@ class VoiceActivityDetector:
         Returns:
             True if the audio energy exceeds the threshold.
         """
-        num_samples = len(audio_frame) // 2
-        if num_samples == 0:
+        pcm = np.frombuffer(audio_frame, dtype=np.int16, count=len(audio_frame) // 2)
+        if pcm.size == 0:
             return False
 
-        pcm = struct.unpack_from(f"{num_samples}h", audio_frame)
-        rms = np.sqrt(np.mean(np.array(pcm, dtype=np.float64) ** 2))
+        # Integer sum of squares; int64 so long buffers can't overflow
+        wide = pcm.astype(np.int64)
+        rms = math.sqrt(int(np.dot(wide, wide)) / pcm.size)
         return rms > threshold
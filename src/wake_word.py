@@ -25,20 +25,21 @@ class WakeWordDetector:
         self.sensitivity: float = config.get("sensitivity", 0.5)
         self._porcupine: Optional[pvporcupine.Porcupine] = None
 
+        # Engine constants, cached at initialize() so the per-frame path
+        # doesn't call into the Porcupine binding for them.
+        # Defaults apply before initialization.
+        self._frame_length: int = 512
+        self._sample_rate: int = 16000
+
     @property
     def frame_length(self) -> int:
         """Number of audio samples per frame required by Porcupine."""
-        if self._porcupine is None:
-            # Default frame length before initialization
-            return 512
-        return self._porcupine.frame_length
+        return self._frame_length
 
     @property
     def sample_rate(self) -> int:
         """Sample rate required by Porcupine."""
-        if self._porcupine is None:
-            return 16000
-        return self._porcupine.sample_rate
+        return self._sample_rate
 
     def initialize(self) -> None:
         """Initialize the Porcupine engine."""
@@ -66,6 +67,8 @@ class WakeWordDetector:
                     sensitivities=[self.sensitivity],
                 )
 
+            self._frame_length = self._porcupine.frame_length
+            self._sample_rate = self._porcupine.sample_rate
             logger.info(
                 f"Porcupine initialized (frame_length={self.frame_length}, "
                 f"sample_rate={self.sample_rate})"
@@ -88,15 +91,17 @@ class WakeWordDetector:
         if self._porcupine is None:
             raise RuntimeError("WakeWordDetector not initialized. Call initialize() first.")
 
-        # Convert bytes to list of int16 values
+        # Convert bytes to a tuple of int16 values. Porcupine copies them into
+        # a ctypes array one Python int at a time, and plain ints unpack
+        # faster there than NumPy scalars from an ndarray would.
         num_samples = len(audio_frame) // 2
         pcm = struct.unpack_from(f"{num_samples}h", audio_frame)
 
         # Porcupine expects exactly frame_length samples
-        if len(pcm) != self._porcupine.frame_length:
+        if len(pcm) != self._frame_length:
             logger.warning(
                 f"Frame size mismatch: got {len(pcm)}, "
-                f"expected {self._porcupine.frame_length}"
+                f"expected {self._frame_length}"
             )
             return False
 
@@ -0,0 +1,36 @@
+"""
+WAV container helpers.
+
+Kept free of audio-device and other heavy dependencies so that modules
+which only need to package PCM (such as stt.py) can import it cheaply.
+"""
+
+import struct
+
+
+def pcm_to_wav_bytes(
+    pcm: bytes, rate: int, channels: int = 1, sampwidth: int = 2
+) -> bytes:
+    """
+    Wrap raw PCM data in a WAV container.
+
+    Builds the 44-byte RIFF/WAVE header with struct and prepends it, so the
+    payload is copied exactly once.
+
+    Args:
+        pcm: Raw PCM audio bytes.
+        rate: Sample rate in Hz.
+        channels: Number of interleaved channels.
+        sampwidth: Bytes per sample.
+
+    Returns:
+        WAV file content as bytes.
+    """
+    block_align = channels * sampwidth
+    header = struct.pack(
+        "<4sI8sIHHIIHH4sI",
+        b"RIFF", 36 + len(pcm), b"WAVEfmt ",
+        16, 1, channels, rate, rate * block_align, block_align, sampwidth * 8,
+        b"data", len(pcm),
+    )
+    return header + pcm
@@ -0,0 +1,6 @@
+"""Make the flat modules in src/ importable the way main.py imports them."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
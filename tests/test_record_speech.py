@@ -0,0 +1,135 @@
+"""Clawlexa._record_speech against a fake microphone stream (no audio hardware)."""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from main import Clawlexa
+
+RATE = 16000
+CHUNK = 512
+
+
+def _tone(seconds: float) -> bytes:
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (np.sin(2 * np.pi * 440 * t) * 8000).astype(np.int16).tobytes()
+
+
+def _silence(seconds: float) -> bytes:
+    return bytes(int(seconds * RATE) * 2)
+
+
+class FakeStream:
+    """Serves scripted PCM in PyAudio Stream.read() chunks, then silence."""
+
+    def __init__(self, pcm: bytes) -> None:
+        self.pcm = pcm
+        self.pos = 0
+
+    def read(self, num_frames: int, exception_on_overflow: bool = True) -> bytes:
+        n = num_frames * 2
+        data = self.pcm[self.pos:self.pos + n]
+        self.pos += n
+        return data + bytes(n - len(data))
+
+
+@pytest.fixture
+def clawlexa():
+    app = Clawlexa({
+        "audio": {
+            "sample_rate": RATE,
+            "chunk_size": CHUNK,
+            "silence_threshold": 0.3,
+            "vad_batch_chunks": 3,
+        },
+        "stt": {"api_key": "test-key"},
+        "brain": {"gateway_token": "test-token"},
+    })
+    app._running = True
+    yield app
+    app.tts.cleanup()
+    app._audio_executor.shutdown(wait=False)
+
+
+def _attach(app: Clawlexa, pcm: bytes) -> None:
+    app.audio._stream_read = FakeStream(pcm).read
+
+
+def test_records_speech_until_silence(clawlexa):
+    speech = _tone(0.5)
+    _attach(clawlexa, speech + _silence(2.0))
+
+    recorded = clawlexa._record_speech()
+
+    assert recorded is not None
+    assert recorded.startswith(speech)
+    # Stops after silence_threshold of quiet, well before the input runs out
+    assert len(recorded) < len(speech) + len(_silence(1.0))
+    assert len(recorded) % (CHUNK * 2) == 0
+
+
+def test_starts_with_preroll(clawlexa):
+    # Frames captured while listening for the wake word
+    preroll = _tone(3 * CHUNK / RATE)
+    _attach(clawlexa, preroll)
+    for _ in range(3):
+        clawlexa.audio.read_frame(CHUNK)
+
+    speech = _tone(0.5)
+    _attach(clawlexa, speech + _silence(2.0))
+
+    recorded = clawlexa._record_speech()
+
+    assert recorded is not None
+    assert recorded.startswith(preroll + speech)
+
+
+def test_returns_none_without_speech(clawlexa):
+    _attach(clawlexa, _silence(0.5))
+
+    # No speech: recording runs until the 30s cap, returning nothing
+    assert clawlexa._record_speech() is None
+
+
+def test_full_preroll_fits_a_max_length_recording(clawlexa):
+    _attach(clawlexa, _tone(1.0))
+    for _ in range(clawlexa.audio._preroll.maxlen):
+        clawlexa.audio.read_frame(CHUNK)
+
+    _attach(clawlexa, _silence(0.5))
+
+    # Pre-roll plus the 30s cap must not overrun the pre-sized buffer
+    assert clawlexa._record_speech() is None
+
+
+def test_early_transcription_waits_out_short_pauses(clawlexa):
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    sent: list[bytes] = []
+
+    async def transcribe(audio_data: bytes, sample_rate: int = RATE) -> str:
+        sent.append(audio_data)
+        return "hello"
+
+    clawlexa.stt.transcribe = transcribe
+    clawlexa._silence_threshold = 0.6
+    clawlexa._early_transcribe_after = 0.3
+    # A 0.25s pause between phrases spans whole silent VAD batches, but is
+    # shorter than early_transcribe_after
+    speech = _tone(0.5) + _silence(0.25) + _tone(0.5)
+    _attach(clawlexa, speech + _silence(2.0))
+
+    try:
+        recorded = clawlexa._record_speech(loop)
+        assert clawlexa._early_transcript is not None
+        assert clawlexa._early_transcript.result(timeout=5) == "hello"
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    assert len(sent) == 1
+    assert sent[0].startswith(speech)
+    assert recorded.startswith(sent[0])
@@ -0,0 +1,83 @@
+"""PiperTTS's on-disk cache of the resolved piper binary and voice model."""
+
+import os
+
+import pytest
+
+import tts
+from tts import PiperTTS
+
+VOICE = "en_US-test-medium"
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "paths.json"
+    monkeypatch.setattr(tts, "_PATH_CACHE", path)
+    return path
+
+
+def _engine(voice_dir) -> PiperTTS:
+    engine = PiperTTS({"voice": VOICE, "voice_dir": str(voice_dir)})
+    engine._piper_bin = "piper"
+    return engine
+
+
+def _resolve_and_cache(voice_dir) -> PiperTTS:
+    engine = _engine(voice_dir)
+    engine._model_path = engine._find_voice_model()
+    engine._save_path_cache()
+    engine.cleanup()
+    return engine
+
+
+def _cached_model(voice_dir):
+    engine = _engine(voice_dir)
+    try:
+        return engine._model_path if engine._load_path_cache() else None
+    finally:
+        engine.cleanup()
+
+
+@pytest.mark.parametrize("subdir", [False, True])
+def test_int8_copy_invalidates_cached_fp32_model(tmp_path, cache_file, subdir):
+    voice_dir = tmp_path / "voices"
+    model_dir = voice_dir / VOICE if subdir else voice_dir
+    model_dir.mkdir(parents=True)
+    (model_dir / f"{VOICE}.onnx").write_bytes(b"fp32")
+
+    _resolve_and_cache(voice_dir)
+    assert _cached_model(voice_dir) == (model_dir / f"{VOICE}.onnx").resolve()
+
+    # scripts/quantize_voice.py output lands next to the FP32 model
+    (model_dir / f"{VOICE}.int8.onnx").write_bytes(b"int8")
+
+    assert _cached_model(voice_dir) is None
+    assert _engine(voice_dir)._find_voice_model() == model_dir / f"{VOICE}.int8.onnx"
+
+
+def test_optimized_graph_write_keeps_cache_valid(tmp_path, cache_file):
+    voice_dir = tmp_path / "voices"
+    voice_dir.mkdir()
+    model = voice_dir / f"{VOICE}.onnx"
+    model.write_bytes(b"fp32")
+    _resolve_and_cache(voice_dir)
+
+    # The cached <voice>.opt.onnx graph written on first load changes the dir mtime
+    (voice_dir / f"{VOICE}.opt.onnx").write_bytes(b"opt")
+    os.utime(voice_dir, (1, 1))
+
+    assert _cached_model(voice_dir) == model.resolve()
+
+
+def test_replaced_model_invalidates_cache(tmp_path, cache_file):
+    voice_dir = tmp_path / "voices"
+    voice_dir.mkdir()
+    model = voice_dir / f"{VOICE}.onnx"
+    model.write_bytes(b"fp32")
+    _resolve_and_cache(voice_dir)
+
+    model.write_bytes(b"newer")
+    os.utime(model, (model.stat().st_atime, model.stat().st_mtime + 10))
+
+    assert _cached_model(voice_dir) is None